@@ -0,0 +1,75 @@
+"""新闻获取模块。
+
+提供 fetch_all 协程，在同一事件循环中并发获取 Hacker News 与 Yahoo News，
+总耗时取决于最慢的新闻源，而非各新闻源耗时之和；两个请求共用一个
+httpx.AsyncClient（同一连接池，安装 h2 后可复用 HTTP/2 连接）。
+"""
+
+import contextlib
+from typing import TYPE_CHECKING
+
+from ._http import client_options
+from .hacker_news import (
+    fetch_hacker_news,
+    fetch_hacker_news_async,
+    fetch_hacker_news_columnar,
+)
+from .yahoo_news import fetch_yahoo_news, fetch_yahoo_news_async
+
+if TYPE_CHECKING:
+    import httpx
+
+
+async def fetch_all(
+    limit_hn: int = 30,
+    limit_yahoo: int = 20,
+    timeout: int = 10,
+    client: 'httpx.AsyncClient | None' = None
+) -> tuple[list[dict[str, str | int]], list[dict[str, str]]]:
+    """并发获取 Hacker News 与 Yahoo News 新闻列表。
+    
+    Args:
+        limit_hn: Hacker News 新闻数量，默认 30
+        limit_yahoo: Yahoo News 新闻数量，默认 20
+        timeout: 每个请求的超时时间（秒），默认 10
+        client: 可选的 httpx.AsyncClient，传入后两个新闻源都复用它；
+            不传则为本次调用创建一个共用的客户端（不读取环境代理），结束后关闭
+        
+    Returns:
+        (Hacker News 新闻列表, Yahoo News 新闻列表)
+        
+    Raises:
+        ConnectionError: 网络连接失败
+        TimeoutError: 请求超时
+        ValueError: HTML 解析失败或数据格式异常
+        
+    Examples:
+        >>> hn, yahoo = asyncio.run(fetch_all(limit_hn=10, limit_yahoo=10))
+        >>> len(hn), len(yahoo)
+        (10, 10)
+    """
+    # asyncio 与 httpx 只在协程实际运行时导入，import 本包时不必加载
+    import asyncio
+    
+    import httpx
+    
+    # 未传入 client 时临时创建一个，两个新闻源共用同一连接池，结束后关闭
+    async with (
+        httpx.AsyncClient(**client_options(trust_env=False)) if client is None
+        else contextlib.nullcontext(client)
+    ) as http:
+        hn_news, yahoo_news = await asyncio.gather(
+            fetch_hacker_news_async(limit_hn, timeout, http),
+            fetch_yahoo_news_async(limit_yahoo, timeout, http),
+        )
+    return hn_news, yahoo_news
+
+
+__all__ = [
+    'fetch_all',
+    'fetch_hacker_news',
+    'fetch_hacker_news_async',
+    'fetch_hacker_news_columnar',
+    'fetch_yahoo_news',
+    'fetch_yahoo_news_async',
+]
@@ -0,0 +1,191 @@
+"""新闻源共用的 HTTP 客户端、异常转换与短时缓存（内部模块）。
+
+每个新闻源模块创建一个 NewsSource 实例，只需给出站点名称、缓存 TTL 和
+站点特有的请求参数；连接复用、异常转换、TTL 缓存和条件请求（ETag /
+Last-Modified）逻辑都在这里实现；html_parser 按响应头声明的字符编码创建
+lxml 解析器，供各新闻源的流式与线程池解析路径共用。
+
+httpx 在首次创建客户端时才导入，import 各新闻源模块时不必加载 httpx。
+"""
+
+import codecs
+import contextlib
+import functools
+import importlib.util
+import time
+from collections.abc import Iterator, Mapping
+from typing import TYPE_CHECKING, Any, Generic, TypeVar
+
+import lxml.html
+
+if TYPE_CHECKING:
+    import httpx
+
+# 流式读取响应体时每次交给解析器的字节数
+CHUNK_SIZE = 16 * 1024
+
+T = TypeVar('T')
+
+
+def html_parser(charset: str | None) -> lxml.html.HTMLParser:
+    """按响应头声明的字符编码创建 lxml HTML 解析器。
+    
+    新闻页面的编码只能依赖 Content-Type 的 charset（如 HN 页面没有 <meta charset>），
+    不显式指定时 libxml2 会按 Latin-1 解码。charset 缺失、Python 或 libxml2
+    不认识时按 UTF-8 解码，不把 LookupError 抛给调用方。
+    
+    Args:
+        charset: 响应头中的 charset 标签，可能为 None
+    """
+    try:
+        codecs.lookup(charset or 'utf-8')
+        return lxml.html.HTMLParser(encoding=charset or 'utf-8')
+    except LookupError:
+        return lxml.html.HTMLParser(encoding='utf-8')
+
+
+def client_options(
+    headers: Mapping[str, str] | None = None,
+    trust_env: bool = True
+) -> dict[str, Any]:
+    """返回 httpx 客户端的构造参数。
+    
+    Args:
+        headers: 每个请求都附带的请求头，默认不额外添加
+        trust_env: 是否读取环境变量中的代理等配置，默认 True
+    """
+    import httpx
+    
+    # httpx 默认的 Accept-Encoding 仅声明其能够解码的压缩格式（安装 brotli 后才包含 br）
+    return {
+        'headers': headers,
+        # 安装 h2 后启用 HTTP/2，同一主机的多个请求复用一条 TLS 连接
+        'http2': importlib.util.find_spec('h2') is not None,
+        'limits': httpx.Limits(max_connections=10, max_keepalive_connections=4),
+        'follow_redirects': True,
+        # 证书校验使用 httpx 默认的 certifi CA 证书包
+        'trust_env': trust_env,
+    }
+
+
+class NewsSource(Generic[T]):
+    """单个新闻源的 httpx 客户端与短时缓存。
+
+    缓存以 limit 为键保存解析结果，TTL 内的重复调用直接返回缓存结果；
+    过期后携带上次响应的 ETag / Last-Modified 发送条件请求，
+    页面未变化时服务器返回 304 且不含响应体，省去下载和解析。
+
+    Args:
+        name: 站点名称，用于错误信息
+        ttl: 缓存有效期（秒）
+        headers: 每个请求都附带的请求头，默认不额外添加
+        trust_env: 是否读取环境变量中的代理等配置，默认 True
+    """
+
+    def __init__(
+        self,
+        name: str,
+        ttl: float,
+        headers: Mapping[str, str] | None = None,
+        trust_env: bool = True
+    ) -> None:
+        self.name = name
+        self.ttl = ttl
+        self.headers = headers
+        self.trust_env = trust_env
+        # limit -> (获取时间, 解析结果)
+        self._cache: dict[int, tuple[float, T]] = {}
+        # limit -> 上次响应的 ETag / Last-Modified
+        self._last_etag: dict[int, str] = {}
+        self._last_modified: dict[int, str] = {}
+
+    def cache_clear(self) -> None:
+        """清空新闻缓存，下一次调用将重新请求并解析页面。"""
+        self._cache.clear()
+        self._last_etag.clear()
+        self._last_modified.clear()
+
+    def client_options(self) -> dict[str, Any]:
+        """返回本新闻源同步与异步 httpx 客户端共用的构造参数。"""
+        return client_options(self.headers, self.trust_env)
+
+    @functools.cached_property
+    def client(self) -> 'httpx.Client':
+        """同步请求共用的 httpx.Client，首次访问时才导入 httpx 并完成初始化。
+        
+        Client 跨调用复用连接池，避免每次请求重新握手。
+        """
+        import httpx
+        
+        return httpx.Client(**self.client_options())
+
+    def async_client(
+        self,
+        client: 'httpx.AsyncClient | None'
+    ) -> contextlib.AbstractAsyncContextManager['httpx.AsyncClient']:
+        """返回异步请求使用的客户端上下文。
+        
+        传入 client 时直接复用且不负责关闭；否则临时创建一个，退出上下文时关闭。
+        """
+        import httpx
+        
+        if client is None:
+            return httpx.AsyncClient(**self.client_options())
+        return contextlib.nullcontext(client)
+
+    @contextlib.contextmanager
+    def translate_errors(self, timeout: int) -> Iterator[None]:
+        """将 httpx 异常转换为约定的 ConnectionError / TimeoutError。"""
+        import httpx
+        
+        try:
+            yield
+        except httpx.TimeoutException as e:
+            raise TimeoutError(f"请求超时（{timeout}秒）: {e}") from e
+        except httpx.NetworkError as e:
+            raise ConnectionError(f"无法连接到 {self.name}: {e}") from e
+        except httpx.HTTPError as e:
+            raise ConnectionError(f"请求失败: {e}") from e
+
+    def cached(self, limit: int) -> T | None:
+        """返回 TTL 内仍然有效的缓存结果，没有则返回 None。"""
+        cached = self._cache.get(limit)
+        if cached is not None and time.monotonic() - cached[0] < self.ttl:
+            return cached[1]
+        return None
+
+    def conditional_headers(self, limit: int) -> dict[str, str]:
+        """缓存过期但仍有上次结果时，构造条件请求头。"""
+        headers: dict[str, str] = {}
+        if limit in self._cache:
+            if limit in self._last_etag:
+                headers['If-None-Match'] = self._last_etag[limit]
+            if limit in self._last_modified:
+                headers['If-Modified-Since'] = self._last_modified[limit]
+        return headers
+
+    def revalidate(self, limit: int) -> T:
+        """收到 304 时刷新缓存时间并返回上次结果。
+        
+        Raises:
+            ValueError: 没有可复用的缓存结果（如请求期间缓存被清空，
+                或服务器返回了未经请求的 304）
+        """
+        cached = self._cache.get(limit)
+        if cached is None:
+            raise ValueError(f"{self.name} 返回 304，但没有可复用的缓存结果")
+        self._cache[limit] = (time.monotonic(), cached[1])
+        return cached[1]
+
+    def store(self, limit: int, value: T, headers: Mapping[str, str]) -> T:
+        """写入缓存并记录响应的 ETag / Last-Modified，供缓存过期后发送条件请求。"""
+        self._cache[limit] = (time.monotonic(), value)
+        for header, store in (
+            ('ETag', self._last_etag),
+            ('Last-Modified', self._last_modified),
+        ):
+            if validator := headers.get(header):
+                store[limit] = validator
+            else:
+                store.pop(limit, None)
+        return value
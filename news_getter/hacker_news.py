@@ -22,8 +22,17 @@
   * date: str - 发布时间（相对时间，如 "2 hours ago"）
 
 技术要点:
-- 使用 requests 库发送 HTTP 请求
-- 使用 BeautifulSoup 解析 HTML
+- 使用 httpx 发送 HTTP 请求（复用模块级 Client，保持长连接与连接池；安装 h2 后
+  启用 HTTP/2 多路复用；httpx 与 asyncio 在首次请求时才导入，加快模块导入速度）
+- 使用 lxml 解析 HTML，通过模块级预编译的 XPath 一次性提取新闻条目
+- 启用压缩传输（gzip/deflate，安装 brotli 后自动追加 br），以流式方式边下载边把
+  响应字节交给 lxml 增量解析，省去完整 bytes/str 副本；字符编码取自响应头的
+  charset（缺省按 UTF-8），因为 HN 页面本身不声明编码
+- 提供 fetch_hacker_news_columnar 列式（SoA）接口，解析时直接按列累积；
+  fetch_hacker_news 是其上的逐条字典适配层
+- 提供 fetch_hacker_news_async 协程，基于 httpx.AsyncClient 非阻塞请求，
+  可与其他新闻源并发获取；HTML 解析放到线程池执行，不阻塞事件循环
+- 30 秒内的重复调用直接返回缓存结果，不再重复请求和解析（cache_clear() 可清空）
 - 处理可能的网络异常和解析错误
 - 完整的 Python 3.12 类型注释
 - 遵循 PEP 规范
@@ -42,14 +51,52 @@
 - HTML 结构变化的容错处理
 
 依赖:
-- requests: HTTP 请求库
-- beautifulsoup4: HTML 解析库
-- lxml: BeautifulSoup 解析器（可选，性能更好）
+- httpx: HTTP 请求库
+- h2: HTTP/2 支持（可选，安装后自动启用 HTTP/2）
+- lxml: HTML 解析库（C 实现，支持预编译 XPath）
+- brotli: br 压缩解码（可选，安装后自动声明并解码 br 响应）
 """
 
-import requests
-from bs4 import BeautifulSoup
-from typing import TypedDict
+import re
+import sys
+from array import array
+
+import lxml.html
+from lxml import etree
+from typing import TYPE_CHECKING, TypedDict
+
+from ._http import CHUNK_SIZE, NewsSource, html_parser
+
+if TYPE_CHECKING:
+    import httpx
+
+_HN_BASE_URL = "https://news.ycombinator.com/"
+# 得分文本形如 "123 points"
+_SCORE_RE = re.compile(r'(\d+)')
+# 驻留重复出现的作者、时间字符串，多条新闻共享同一个 str 对象以减少内存占用
+_UNKNOWN = sys.intern("unknown")
+
+
+def _has_class(name: str) -> str:
+    """生成匹配 class 属性中包含指定类名的 XPath 谓词（兼容多个类名）。"""
+    return f"contains(concat(' ', normalize-space(@class), ' '), ' {name} ')"
+
+
+# 预编译 XPath：导入时编译一次，每次调用直接在 C 层遍历
+_XP_STORY_ROWS = etree.XPath(f"(//tr[{_has_class('athing')}])[position() <= $limit]")
+_XP_TITLE_LINK = etree.XPath(f".//span[{_has_class('titleline')}]/a")
+_XP_SUBTEXT = etree.XPath(f"following-sibling::tr[1]//td[{_has_class('subtext')}]")
+# 得分、作者、时间直接用 string 类 XPath 在 C 层取出文本，不再逐个返回元素后
+# 在 Python 中拼接文本（smart_strings=False 返回普通 str，不持有文档树引用）
+_XP_SCORE = etree.XPath(
+    f"normalize-space(.//span[{_has_class('score')}])", smart_strings=False
+)
+_XP_AUTHOR = etree.XPath(
+    f"normalize-space(.//a[{_has_class('hnuser')}])", smart_strings=False
+)
+_XP_AGE = etree.XPath(
+    f"normalize-space(.//span[{_has_class('age')}]/a)", smart_strings=False
+)
 
 
 class HackerNewsItem(TypedDict):
@@ -61,6 +108,208 @@ class HackerNewsItem(TypedDict):
     date: str
 
 
+class HackerNewsColumns(TypedDict):
+    """Hacker News 新闻列式（SoA）结果类型定义，各列同一下标对应同一条新闻。"""
+    title: list[str]
+    url: list[str]
+    score: array  # array('i')，int32，可零拷贝转为 numpy 数组
+    author: list[str]
+    date: list[str]
+
+
+# 连接池与短时缓存：同一 limit 的结果缓存 30 秒，过期后发送条件请求
+_source: NewsSource[HackerNewsColumns] = NewsSource("Hacker News", ttl=30.0)
+cache_clear = _source.cache_clear
+
+
+def _extract_columns(
+    tree: lxml.html.HtmlElement,
+    limit: int
+) -> HackerNewsColumns:
+    """按页面顺序从文档树中提取前 limit 条新闻，逐列累积而不构建逐条字典。"""
+    # Hacker News 的 HTML 结构：
+    # - 新闻标题在 <span class="titleline"> 内的 <a> 标签
+    # - 元数据（分数、作者、时间）在下一行的 <td class="subtext"> 内
+    titles: list[str] = []
+    urls: list[str] = []
+    scores = array('i')
+    authors: list[str] = []
+    dates: list[str] = []
+    
+    # 获取前 limit 个新闻行（athing class）
+    for story in _XP_STORY_ROWS(tree, limit=limit):
+        # 缺少标题链接或元数据行的条目直接跳过
+        if not (links := _XP_TITLE_LINK(story)):
+            continue
+        if not (subtexts := _XP_SUBTEXT(story)):
+            continue
+        
+        link = links[0]
+        subtext = subtexts[0]
+        
+        # 处理相对链接（HN 内部链接，如 "item?id=..."）
+        href = link.get('href', '')
+        if not href.startswith(('http://', 'https://')):
+            href = f"{_HN_BASE_URL}{href}"
+        
+        # 提取得分，格式: "123 points"
+        match = _SCORE_RE.match(_XP_SCORE(subtext))
+        
+        # 提取作者和时间
+        author = _XP_AUTHOR(subtext)
+        age = _XP_AGE(subtext)
+        
+        titles.append(link.text_content().strip())
+        urls.append(href)
+        scores.append(int(match.group(1)) if match else 0)
+        authors.append(sys.intern(author) if author else _UNKNOWN)
+        dates.append(sys.intern(age) if age else _UNKNOWN)
+    
+    return {
+        'title': titles,
+        'url': urls,
+        'score': scores,
+        'author': authors,
+        'date': dates,
+    }
+
+
+def _sort_columns(columns: HackerNewsColumns) -> HackerNewsColumns:
+    """按赞数（score）倒序重排各列，得分相同的保持页面顺序。"""
+    scores = columns['score']
+    order = sorted(range(len(scores)), key=scores.__getitem__, reverse=True)
+    return {
+        'title': [columns['title'][i] for i in order],
+        'url': [columns['url'][i] for i in order],
+        'score': array('i', [scores[i] for i in order]),
+        'author': [columns['author'][i] for i in order],
+        'date': [columns['date'][i] for i in order],
+    }
+
+
+def _copy_columns(columns: HackerNewsColumns) -> HackerNewsColumns:
+    """浅拷贝各列，避免调用方修改结果时污染缓存。"""
+    return {
+        'title': columns['title'][:],
+        'url': columns['url'][:],
+        'score': columns['score'][:],
+        'author': columns['author'][:],
+        'date': columns['date'][:],
+    }
+
+
+def _to_items(columns: HackerNewsColumns) -> list[dict[str, str | int]]:
+    """将列式数据转换为逐条字典列表。"""
+    return [
+        {'title': title, 'url': url, 'score': score, 'author': author, 'date': date}
+        for title, url, score, author, date in zip(
+            columns['title'],
+            columns['url'],
+            columns['score'],
+            columns['author'],
+            columns['date'],
+        )
+    ]
+
+
+def _parse_columns(
+    parser: lxml.html.HTMLParser,
+    limit: int
+) -> HackerNewsColumns:
+    """结束增量解析，提取并按赞数倒序排列新闻列。
+    
+    Raises:
+        ValueError: HTML 解析失败或未能解析出任何新闻条目
+    """
+    try:
+        # 结束增量解析，取得文档根节点
+        tree = parser.close()
+        if tree is None:
+            raise ValueError("响应内容为空，无法解析")
+        
+        columns = _extract_columns(tree, limit)
+        if not columns['title']:
+            raise ValueError("未能解析出任何新闻条目，HTML 结构可能已变化")
+        
+        # 按赞数（score）倒序排列
+        return _sort_columns(columns)
+        
+    except Exception as e:
+        if isinstance(e, ValueError):
+            raise
+        raise ValueError(f"HTML 解析失败: {e}") from e
+
+
+def _parse_hn(html: bytes, limit: int, charset: str | None) -> HackerNewsColumns:
+    """解析完整的响应字节，不依赖也不修改模块状态，可安全地在线程池中执行。"""
+    parser = html_parser(charset)
+    parser.feed(html)
+    return _parse_columns(parser, limit)
+
+
+def _fetch_columns(limit: int, timeout: int) -> HackerNewsColumns:
+    """获取按赞数倒序排列的列式新闻数据（含缓存与条件请求）。
+    
+    返回值与缓存共享，调用方需自行拷贝后再交给外部使用。
+    """
+    if (columns := _source.cached(limit)) is not None:
+        return columns
+    
+    headers = _source.conditional_headers(limit)
+    with _source.translate_errors(timeout):
+        # 发送 HTTP 请求，以流式方式边下载边交给 lxml 增量解析
+        with _source.client.stream(
+            'GET', _HN_BASE_URL, headers=headers, timeout=timeout
+        ) as response:
+            not_modified = response.status_code == 304
+            if not not_modified:
+                response.raise_for_status()
+                # 按响应头声明的编码解码（缺失或无效时按 UTF-8）
+                parser = html_parser(response.charset_encoding)
+                for chunk in response.iter_bytes(CHUNK_SIZE):
+                    parser.feed(chunk)
+            response_headers = response.headers
+    
+    if not_modified:
+        return _source.revalidate(limit)
+    
+    return _source.store(limit, _parse_columns(parser, limit), response_headers)
+
+
+async def _fetch_columns_async(
+    limit: int,
+    timeout: int,
+    client: 'httpx.AsyncClient | None'
+) -> HackerNewsColumns:
+    """_fetch_columns 的异步版本，与同步版本共享缓存。"""
+    import asyncio
+    
+    if (columns := _source.cached(limit)) is not None:
+        return columns
+    
+    headers = _source.conditional_headers(limit)
+    with _source.translate_errors(timeout):
+        # 未传入 client 时临时创建一个，请求结束后关闭；调用方传入的 client
+        # 未必开启跟随重定向，因此在每个请求上显式指定
+        async with _source.async_client(client) as http:
+            response = await http.get(
+                _HN_BASE_URL, headers=headers, timeout=timeout, follow_redirects=True
+            )
+        not_modified = response.status_code == 304
+        if not not_modified:
+            response.raise_for_status()
+    
+    if not_modified:
+        return _source.revalidate(limit)
+    
+    # 解析是 CPU 密集操作，放到线程池执行以免阻塞事件循环（lxml 解析时会释放 GIL）
+    loop = asyncio.get_running_loop()
+    parsed = await loop.run_in_executor(
+        None, _parse_hn, response.content, limit, response.charset_encoding
+    )
+    return _source.store(limit, parsed, response.headers)
+
+
 def fetch_hacker_news(
     limit: int = 30,
     timeout: int = 10
@@ -79,6 +328,9 @@ def fetch_hacker_news(
         - author: 发布者用户名
         - date: 发布时间
         
+    Note:
+        同一 limit 的结果会缓存 30 秒，缓存期内直接返回缓存副本。
+        
     Raises:
         ConnectionError: 网络连接失败
         TimeoutError: 请求超时
@@ -91,105 +343,71 @@ def fetch_hacker_news(
         >>> news[0]['title']
         'Some interesting news title'
     """
-    url = "https://news.ycombinator.com/"
+    return _to_items(_fetch_columns(limit, timeout))
+
+
+def fetch_hacker_news_columnar(
+    limit: int = 30,
+    timeout: int = 10
+) -> HackerNewsColumns:
+    """以列式（SoA）结构获取 Hacker News 新闻，适合批量排序、过滤和导出。
     
-    try:
-        # 发送 HTTP 请求
-        response = requests.get(url, timeout=timeout)
-        response.raise_for_status()
-    except requests.exceptions.ConnectionError as e:
-        raise ConnectionError(f"无法连接到 Hacker News: {e}") from e
-    except requests.exceptions.Timeout as e:
-        raise TimeoutError(f"请求超时（{timeout}秒）: {e}") from e
-    except requests.exceptions.RequestException as e:
-        raise ConnectionError(f"请求失败: {e}") from e
+    与 fetch_hacker_news 共享请求、解析和缓存，但不为每条新闻构建字典。
     
-    try:
-        # 解析 HTML
-        soup = BeautifulSoup(response.text, 'html.parser')
-        
-        # 查找所有新闻条目
-        # Hacker News 的 HTML 结构：
-        # - 新闻标题在 <span class="titleline"> 内的 <a> 标签
-        # - 元数据（分数、作者、时间）在 <span class="subtext"> 内
-        news_items: list[dict[str, str | int]] = []
-        
-        # 获取所有新闻行（athing class）
-        story_rows = soup.find_all('tr', class_='athing', limit=limit)
-        
-        for story in story_rows:
-            try:
-                # 提取标题和链接
-                titleline = story.find('span', class_='titleline')
-                if not titleline:
-                    continue
-                
-                link = titleline.find('a')
-                if not link:
-                    continue
-                
-                title = link.get_text(strip=True)
-                href = link.get('href', '')
-                
-                # 处理相对链接（HN 内部链接）
-                if href.startswith('item?id='):
-                    href = f"https://news.ycombinator.com/{href}"
-                
-                # 获取元数据行（紧跟在新闻行后面）
-                subtext_row = story.find_next_sibling('tr')
-                if not subtext_row:
-                    continue
-                
-                subtext = subtext_row.find('td', class_='subtext')
-                if not subtext:
-                    continue
-                
-                # 提取得分
-                score_span = subtext.find('span', class_='score')
-                score = 0
-                if score_span:
-                    score_text = score_span.get_text(strip=True)
-                    # 格式: "123 points"
-                    score = int(score_text.split()[0]) if score_text else 0
-                
-                # 提取作者
-                author_link = subtext.find('a', class_='hnuser')
-                author = author_link.get_text(strip=True) if author_link else "unknown"
-                
-                # 提取时间
-                age_span = subtext.find('span', class_='age')
-                date = "unknown"
-                if age_span:
-                    age_link = age_span.find('a')
-                    date = age_link.get_text(strip=True) if age_link else "unknown"
-                
-                # 构建新闻条目
-                news_item: dict[str, str | int] = {
-                    'title': title,
-                    'url': href,
-                    'score': score,
-                    'author': author,
-                    'date': date
-                }
-                
-                news_items.append(news_item)
-                
-            except (AttributeError, ValueError, IndexError) as e:
-                # 单个条目解析失败，跳过并继续处理下一个
-                continue
-        
-        if not news_items:
-            raise ValueError("未能解析出任何新闻条目，HTML 结构可能已变化")
+    Args:
+        limit: 获取的新闻数量，默认 30（首页默认显示数量）
+        timeout: 请求超时时间（秒），默认 10
         
-        # 按赞数（score）倒序排列
-        news_items.sort(key=lambda x: x['score'], reverse=True)
+    Returns:
+        按赞数倒序排列的列式数据，包含等长的 title、url、score、author、date
+        五列；score 为 array('i')，可用 numpy.frombuffer(..., dtype=numpy.int32)
+        零拷贝转换
         
-        return news_items
+    Raises:
+        ConnectionError: 网络连接失败
+        TimeoutError: 请求超时
+        ValueError: HTML 解析失败或数据格式异常
         
-    except Exception as e:
-        if isinstance(e, ValueError):
-            raise
-        raise ValueError(f"HTML 解析失败: {e}") from e
+    Examples:
+        >>> columns = fetch_hacker_news_columnar(limit=10)
+        >>> len(columns['title'])
+        10
+        >>> max(columns['score']) == columns['score'][0]
+        True
+    """
+    return _copy_columns(_fetch_columns(limit, timeout))
+
+
+async def fetch_hacker_news_async(
+    limit: int = 30,
+    timeout: int = 10,
+    client: 'httpx.AsyncClient | None' = None
+) -> list[dict[str, str | int]]:
+    """fetch_hacker_news 的异步版本。
+    
+    基于 httpx.AsyncClient 非阻塞地发送请求，使调用方可以在同一事件循环中
+    并发获取多个新闻源；与 fetch_hacker_news 共享缓存。
+    
+    Args:
+        limit: 获取的新闻数量，默认 30（首页默认显示数量）
+        timeout: 请求超时时间（秒），默认 10
+        client: 可选的 httpx.AsyncClient，传入后复用其连接池；
+            不传则为本次调用临时创建
+        
+    Returns:
+        与 fetch_hacker_news 相同
+        
+    Raises:
+        ConnectionError: 网络连接失败
+        TimeoutError: 请求超时
+        ValueError: HTML 解析失败或数据格式异常
+        
+    Examples:
+        >>> news = asyncio.run(fetch_hacker_news_async(limit=10))
+        >>> len(news)
+        10
+    """
+    return _to_items(await _fetch_columns_async(limit, timeout, client))
 
 
 def main() -> None:
@@ -1,5 +1,15 @@
 """Yahoo News 新闻获取模块。"""
 
-from .yahoo_news import fetch_yahoo_news, YahooNewsItem
+from .yahoo_news import (
+    cache_clear,
+    fetch_yahoo_news,
+    fetch_yahoo_news_async,
+    YahooNewsItem,
+)
 
-__all__ = ['fetch_yahoo_news', 'YahooNewsItem']
+__all__ = [
+    'cache_clear',
+    'fetch_yahoo_news',
+    'fetch_yahoo_news_async',
+    'YahooNewsItem',
+]
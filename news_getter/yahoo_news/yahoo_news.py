@@ -20,8 +20,16 @@
   * date: str - 新闻发布时间
 
 技术要点:
-- 使用 requests 库发送 HTTP 请求
-- 使用 BeautifulSoup 解析 HTML
+- 使用 httpx 发送 HTTP 请求（复用模块级 Client，保持长连接与连接池；安装 h2 后
+  启用 HTTP/2 多路复用；httpx 与 asyncio 在首次请求时才导入，加快模块导入速度）
+- 使用 lxml 解析 HTML，通过模块级预编译的 XPath 直接在 C 层提取新闻条目，
+  不为每个节点构建 Python 包装对象
+- 启用压缩传输（gzip/deflate，安装 brotli 后自动追加 br），以流式方式边下载边把
+  响应字节交给 lxml 增量解析，省去完整 bytes/str 副本；字符编码取自响应头的
+  charset（缺省按 UTF-8）
+- 提供 fetch_yahoo_news_async 协程，基于 httpx.AsyncClient 非阻塞请求，
+  可与其他新闻源并发获取；HTML 解析放到线程池执行，不阻塞事件循环
+- 2 分钟内的重复调用直接返回缓存结果，不再重复请求和解析（cache_clear() 可清空）
 - 处理可能的网络异常和解析错误
 - 完整的 Python 3.12 类型注释
 - 遵循 PEP 规范
@@ -40,18 +48,66 @@
 - HTML 结构变化的容错处理
 
 依赖:
-- requests: HTTP 请求库
-- beautifulsoup4: HTML 解析库
-- lxml: BeautifulSoup 解析器（可选，性能更好）
+- httpx: HTTP 请求库
+- h2: HTTP/2 支持（可选，安装后自动启用 HTTP/2）
+- lxml: HTML 解析库（C 实现，支持预编译 XPath）
+- brotli: br 压缩解码（可选，安装后自动声明并解码 br 响应）
 """
 
-import requests
-from bs4 import BeautifulSoup
-from typing import TypedDict
-import urllib3
+import re
+import sys
 
-# 禁用 SSL 警告（仅用于开发测试）
-urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
+import lxml.html
+from lxml import etree
+from collections.abc import Iterator
+from typing import TYPE_CHECKING, TypedDict
+
+from .._http import CHUNK_SIZE, NewsSource, html_parser
+
+if TYPE_CHECKING:
+    import httpx
+
+# 预编译 XPath：导入时编译一次，每次调用直接在 C 层遍历
+# （smart_strings=False 返回普通 str，结果不再持有对整棵文档树的引用）
+_XP_TITLE_LINK = etree.XPath(".//h3[@data-test-locator='stream-item-title']//a")
+_XP_PUBLISHER = etree.XPath(
+    "normalize-space(.//span[@data-test-locator='stream-item-publisher'])",
+    smart_strings=False,
+)
+_XP_READ_TIME = etree.XPath(
+    "normalize-space(.//span[@data-test-locator='stream-read-time'])",
+    smart_strings=False,
+)
+_ARTICLE_PATH_RE = re.compile(r'/(?:news|articles)/')
+
+# 驻留重复出现的来源、时间字符串，多条新闻共享同一个 str 对象以减少内存占用
+_YAHOO_NEWS = sys.intern("Yahoo News")
+_RECENT = sys.intern("recent")
+
+_YAHOO_URL = "https://news.yahoo.com/"
+# 添加完整的浏览器请求头避免被反爬虫拦截
+# （Accept-Encoding 使用 httpx 默认值，仅声明其能够解码的压缩格式，安装 brotli 后才包含 br）
+_YAHOO_HEADERS = {
+    'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
+    'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8',
+    'Accept-Language': 'en-US,en;q=0.5',
+    'Upgrade-Insecure-Requests': '1'
+}
+
+# 连接池与短时缓存：同一 limit 的结果缓存 2 分钟，过期后发送条件请求（禁用环境代理）
+_source: NewsSource[list[dict[str, str]]] = NewsSource(
+    "Yahoo News", ttl=120.0, headers=_YAHOO_HEADERS, trust_env=False
+)
+cache_clear = _source.cache_clear
+
+
+def _iter_stream_items(
+    tree: lxml.html.HtmlElement
+) -> Iterator[lxml.html.HtmlElement]:
+    """按文档顺序惰性产出 <li class="stream-item"> 新闻条目。"""
+    for li in tree.iter('li'):
+        if 'stream-item' in li.get('class', '').split():
+            yield li
 
 
 class YahooNewsItem(TypedDict):
@@ -62,6 +118,155 @@ class YahooNewsItem(TypedDict):
     date: str
 
 
+def _parse_items(parser: lxml.html.HTMLParser, limit: int) -> list[dict[str, str]]:
+    """结束增量解析，提取前 limit 条新闻。
+    
+    Raises:
+        ValueError: HTML 解析失败或未能解析出任何新闻条目
+    """
+    try:
+        # 结束增量解析，取得文档根节点
+        tree = parser.close()
+        if tree is None:
+            raise ValueError("响应内容为空，无法解析")
+        
+        news_items: list[dict[str, str]] = []
+        
+        # Yahoo News 的 HTML 结构：
+        # - 新闻条目在 <li class="stream-item"> 标签中
+        # - 标题在 <h3 data-test-locator="stream-item-title"> 内的 <a> 标签
+        # - 作者/来源在 <span data-test-locator="stream-item-publisher">
+        # - 阅读时间在 <span data-test-locator="stream-read-time">
+        
+        # 惰性遍历新闻条目，凑够 limit 条立即停止，不预先构建候选列表
+        for item in _iter_stream_items(tree):
+            # 提取链接
+            if not (links := _XP_TITLE_LINK(item)):
+                continue
+            
+            link = links[0]
+            href = link.get('href', '')
+            
+            # 先做廉价的链接校验，被过滤的条目不再提取标题、作者和时间
+            if href.startswith('/'):
+                href = f"https://news.yahoo.com{href}"
+            elif not href.startswith('http'):
+                continue
+            
+            # 确保链接是新闻文章（包含 /news/ 或 /articles/）
+            if not _ARTICLE_PATH_RE.search(href):
+                continue
+            
+            # 跳过空标题
+            if not (title := link.text_content().strip()):
+                continue
+            
+            # 提取作者/来源
+            publisher = _XP_PUBLISHER(item)
+            author = sys.intern(publisher) if publisher else _YAHOO_NEWS
+            
+            # 提取时间（阅读时间或其他时间信息）
+            read_time = _XP_READ_TIME(item)
+            date = sys.intern(read_time) if read_time else _RECENT
+            
+            # 构建新闻条目
+            news_item: dict[str, str] = {
+                'title': title,
+                'url': href,
+                'author': author,
+                'date': date
+            }
+            
+            news_items.append(news_item)
+            if len(news_items) >= limit:
+                break
+        
+        if not news_items:
+            raise ValueError("未能解析出任何新闻条目，HTML 结构可能已变化或需要 JavaScript 渲染")
+        
+        return news_items
+        
+    except Exception as e:
+        if isinstance(e, ValueError):
+            raise
+        raise ValueError(f"HTML 解析失败: {e}") from e
+
+
+def _parse_yahoo(html: bytes, limit: int, charset: str | None) -> list[dict[str, str]]:
+    """从完整的响应字节中提取新闻条目（无副作用，供异步版本在线程池中调用）。"""
+    parser = html_parser(charset)
+    parser.feed(html)
+    return _parse_items(parser, limit)
+
+
+def _copy_items(news_items: list[dict[str, str]]) -> list[dict[str, str]]:
+    """逐条浅拷贝新闻字典，避免调用方修改结果时污染缓存。"""
+    return [item.copy() for item in news_items]
+
+
+def _fetch_items(limit: int, timeout: int) -> list[dict[str, str]]:
+    """获取前 limit 条新闻（含缓存与条件请求）。
+    
+    返回值与缓存共享，调用方需自行拷贝后再交给外部使用。
+    """
+    if (news_items := _source.cached(limit)) is not None:
+        return news_items
+    
+    headers = _source.conditional_headers(limit)
+    with _source.translate_errors(timeout):
+        # 发送 HTTP 请求，以流式方式边下载边交给 lxml 增量解析，不在内存中拼出完整页面
+        with _source.client.stream(
+            'GET', _YAHOO_URL, headers=headers, timeout=timeout
+        ) as response:
+            not_modified = response.status_code == 304
+            if not not_modified:
+                response.raise_for_status()
+                # 按响应头声明的编码解码（缺失或无效时按 UTF-8）
+                parser = html_parser(response.charset_encoding)
+                for chunk in response.iter_bytes(CHUNK_SIZE):
+                    parser.feed(chunk)
+            response_headers = response.headers
+    
+    if not_modified:
+        return _source.revalidate(limit)
+    
+    return _source.store(limit, _parse_items(parser, limit), response_headers)
+
+
+async def _fetch_items_async(
+    limit: int,
+    timeout: int,
+    client: 'httpx.AsyncClient | None'
+) -> list[dict[str, str]]:
+    """_fetch_items 的异步版本，与同步版本共享缓存。"""
+    import asyncio
+    
+    if (news_items := _source.cached(limit)) is not None:
+        return news_items
+    
+    headers = {**_YAHOO_HEADERS, **_source.conditional_headers(limit)}
+    with _source.translate_errors(timeout):
+        # 未传入 client 时临时创建一个，请求结束后关闭；调用方传入的 client
+        # 未必开启跟随重定向，因此在每个请求上显式指定
+        async with _source.async_client(client) as http:
+            response = await http.get(
+                _YAHOO_URL, headers=headers, timeout=timeout, follow_redirects=True
+            )
+        not_modified = response.status_code == 304
+        if not not_modified:
+            response.raise_for_status()
+    
+    if not_modified:
+        return _source.revalidate(limit)
+    
+    # 在默认线程池中解析，事件循环在此期间可继续处理其他请求
+    loop = asyncio.get_running_loop()
+    parsed = await loop.run_in_executor(
+        None, _parse_yahoo, response.content, limit, response.charset_encoding
+    )
+    return _source.store(limit, parsed, response.headers)
+
+
 def fetch_yahoo_news(
     limit: int = 20,
     timeout: int = 10
@@ -79,6 +284,9 @@ def fetch_yahoo_news(
         - author: 新闻作者/来源
         - date: 新闻发布时间
         
+    Note:
+        同一 limit 的结果会缓存 2 分钟，缓存期内直接返回缓存副本。
+        
     Raises:
         ConnectionError: 网络连接失败
         TimeoutError: 请求超时
@@ -91,117 +299,39 @@ def fetch_yahoo_news(
         >>> news[0]['title']
         'Some interesting news title'
     """
-    url = "https://news.yahoo.com/"
+    return _copy_items(_fetch_items(limit, timeout))
+
+
+async def fetch_yahoo_news_async(
+    limit: int = 20,
+    timeout: int = 10,
+    client: 'httpx.AsyncClient | None' = None
+) -> list[dict[str, str]]:
+    """fetch_yahoo_news 的异步版本。
     
-    try:
-        # 发送 HTTP 请求，添加完整的浏览器请求头避免被反爬虫拦截
-        headers = {
-            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
-            'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8',
-            'Accept-Language': 'en-US,en;q=0.5',
-            'Accept-Encoding': 'gzip, deflate, br',
-            'Connection': 'keep-alive',
-            'Upgrade-Insecure-Requests': '1'
-        }
-        
-        # 创建 session 以更好地处理连接
-        session = requests.Session()
-        session.headers.update(headers)
-        
-        # 禁用代理
-        session.trust_env = False
-        proxies = {
-            'http': None,
-            'https': None,
-        }
-        
-        # 发送请求，关闭 SSL 验证（仅用于开发测试）
-        response = session.get(url, timeout=timeout, verify=False, proxies=proxies)
-        response.raise_for_status()
-    except requests.exceptions.ConnectionError as e:
-        raise ConnectionError(f"无法连接到 Yahoo News: {e}") from e
-    except requests.exceptions.Timeout as e:
-        raise TimeoutError(f"请求超时（{timeout}秒）: {e}") from e
-    except requests.exceptions.RequestException as e:
-        raise ConnectionError(f"请求失败: {e}") from e
+    基于 httpx.AsyncClient 非阻塞地发送请求，使调用方可以在同一事件循环中
+    并发获取多个新闻源；与 fetch_yahoo_news 共享缓存。
     
-    try:
-        # 解析 HTML
-        soup = BeautifulSoup(response.text, 'html.parser')
-        
-        news_items: list[dict[str, str]] = []
-        
-        # Yahoo News 的 HTML 结构：
-        # - 新闻条目在 <li class="stream-item"> 标签中
-        # - 标题在 <h3 data-test-locator="stream-item-title"> 内的 <a> 标签
-        # - 作者/来源在 <span data-test-locator="stream-item-publisher">
-        # - 阅读时间在 <span data-test-locator="stream-read-time">
-        
-        # 查找所有新闻条目
-        stream_items = soup.find_all('li', class_='stream-item', limit=limit * 2)  # 获取更多以防过滤后不足
-        
-        for item in stream_items:
-            if len(news_items) >= limit:
-                break
-            
-            try:
-                # 提取标题和链接
-                title_elem = item.find('h3', attrs={'data-test-locator': 'stream-item-title'})
-                if not title_elem:
-                    continue
-                
-                link = title_elem.find('a')
-                if not link:
-                    continue
-                
-                title = link.get_text(strip=True)
-                href = link.get('href', '')
-                
-                # 跳过空标题或无效链接
-                if not title or not href:
-                    continue
-                
-                # 处理相对链接
-                if href.startswith('/'):
-                    href = f"https://news.yahoo.com{href}"
-                elif not href.startswith('http'):
-                    continue
-                
-                # 确保链接是新闻文章（包含 /news/ 或 /articles/）
-                if '/news/' not in href and '/articles/' not in href:
-                    continue
-                
-                # 提取作者/来源
-                author_elem = item.find('span', attrs={'data-test-locator': 'stream-item-publisher'})
-                author = author_elem.get_text(strip=True) if author_elem else "Yahoo News"
-                
-                # 提取时间（阅读时间或其他时间信息）
-                time_elem = item.find('span', attrs={'data-test-locator': 'stream-read-time'})
-                date = time_elem.get_text(strip=True) if time_elem else "recent"
-                
-                # 构建新闻条目
-                news_item: dict[str, str] = {
-                    'title': title,
-                    'url': href,
-                    'author': author,
-                    'date': date
-                }
-                
-                news_items.append(news_item)
-                
-            except (AttributeError, ValueError, IndexError):
-                # 单个条目解析失败，跳过并继续处理下一个
-                continue
+    Args:
+        limit: 获取的新闻数量，默认 20
+        timeout: 请求超时时间（秒），默认 10
+        client: 可选的 httpx.AsyncClient，传入后复用其连接池（浏览器请求头
+            会随请求一并发送）；不传则为本次调用临时创建
         
-        if not news_items:
-            raise ValueError("未能解析出任何新闻条目，HTML 结构可能已变化或需要 JavaScript 渲染")
+    Returns:
+        与 fetch_yahoo_news 相同
         
-        return news_items
+    Raises:
+        ConnectionError: 网络连接失败
+        TimeoutError: 请求超时
+        ValueError: HTML 解析失败或数据格式异常
         
-    except Exception as e:
-        if isinstance(e, ValueError):
-            raise
-        raise ValueError(f"HTML 解析失败: {e}") from e
+    Examples:
+        >>> news = asyncio.run(fetch_yahoo_news_async(limit=10))
+        >>> len(news)
+        10
+    """
+    return _copy_items(await _fetch_items_async(limit, timeout, client))
 
 
 def main() -> None:
@@ -0,0 +1,110 @@
+"""新闻获取模块测试共用的 fixture：用 httpx.MockTransport 模拟新闻站点，不访问网络。"""
+
+import asyncio
+from collections.abc import Awaitable, Callable, Iterator
+from typing import Any
+
+import httpx
+import pytest
+
+from news_getter import hacker_news
+from news_getter._http import NewsSource
+from news_getter.yahoo_news import yahoo_news
+
+
+class FakeSite:
+    """以固定页面响应请求的 MockTransport 处理函数，并记录收到的请求。
+
+    带上一次下发的 ETag 发起条件请求时返回 304；指定 redirect_host 时，
+    发往该主机的请求先被 301 重定向到 moved.example 上的同一路径。
+
+    Args:
+        body: 响应体
+        charset: Content-Type 中声明的字符编码，None 表示不声明
+        status: 响应状态码，304 表示无论请求如何都返回 304
+        redirect_host: 需要重定向的主机名
+    """
+
+    etag = '"v1"'
+
+    def __init__(
+        self,
+        body: bytes = b'',
+        charset: str | None = 'utf-8',
+        status: int = 200,
+        redirect_host: str | None = None
+    ) -> None:
+        self.body = body
+        self.charset = charset
+        self.status = status
+        self.redirect_host = redirect_host
+        self.requests: list[httpx.Request] = []
+
+    def __call__(self, request: httpx.Request) -> httpx.Response:
+        self.requests.append(request)
+        if request.url.host == self.redirect_host:
+            return httpx.Response(
+                301, headers={'Location': f"https://moved.example{request.url.path}"}
+            )
+        if self.status == 304 or request.headers.get('If-None-Match') == self.etag:
+            return httpx.Response(304, headers={'ETag': self.etag})
+        content_type = 'text/html'
+        if self.charset:
+            content_type = f"{content_type}; charset={self.charset}"
+        return httpx.Response(
+            self.status,
+            headers={'Content-Type': content_type, 'ETag': self.etag},
+            content=self.body,
+        )
+
+
+@pytest.fixture(autouse=True)
+def _clear_caches() -> Iterator[None]:
+    """每个用例前后清空两个新闻源的缓存。"""
+    hacker_news.cache_clear()
+    yahoo_news.cache_clear()
+    yield
+    hacker_news.cache_clear()
+    yahoo_news.cache_clear()
+
+
+@pytest.fixture
+def fake_site() -> type[FakeSite]:
+    """返回 FakeSite 类，供用例按需构造模拟站点。"""
+    return FakeSite
+
+
+@pytest.fixture
+def use_site(
+    monkeypatch: pytest.MonkeyPatch
+) -> Callable[[NewsSource[Any], FakeSite], None]:
+    """返回一个函数，把新闻源的模块级 Client 换成走 MockTransport 的 Client。"""
+    def use(source: NewsSource[Any], site: FakeSite) -> None:
+        client = httpx.Client(
+            transport=httpx.MockTransport(site), **source.client_options()
+        )
+        monkeypatch.setattr(source, 'client', client)
+
+    return use
+
+
+@pytest.fixture
+def run_async() -> Callable[..., Any]:
+    """返回一个函数，用调用方传入的 MockTransport AsyncClient 运行异步获取函数。
+
+    AsyncClient 使用 httpx 默认参数（不跟随重定向、无额外请求头），
+    模拟调用方自行创建的客户端。
+    """
+    def run(
+        fetcher: Callable[..., Awaitable[Any]],
+        site: FakeSite,
+        **kwargs: Any
+    ) -> Any:
+        async def fetch() -> Any:
+            transport = httpx.MockTransport(site)
+            async with httpx.AsyncClient(transport=transport) as client:
+                return await fetcher(client=client, **kwargs)
+
+        return asyncio.run(fetch())
+
+    return run
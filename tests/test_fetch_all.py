@@ -0,0 +1,43 @@
+"""fetch_all 并发获取测试（使用 httpx.MockTransport，不访问网络）。"""
+
+import asyncio
+
+import httpx
+
+from news_getter import fetch_all
+
+_HN_PAGE = b"""
+<html><body><table>
+<tr class="athing"><td><span class="titleline"><a href="https://example.com/1">HN story</a></span></td></tr>
+<tr><td class="subtext"><span class="score">3 points</span></td></tr>
+</table></body></html>
+"""
+_YAHOO_PAGE = b"""
+<html><body><ul><li class="stream-item">
+<h3 data-test-locator="stream-item-title"><a href="/news/story.html">Yahoo story</a></h3>
+</li></ul></body></html>
+"""
+
+
+def test_fetch_all_shares_the_caller_client() -> None:
+    hosts: list[str] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        hosts.append(request.url.host)
+        body = _HN_PAGE if request.url.host == 'news.ycombinator.com' else _YAHOO_PAGE
+        return httpx.Response(
+            200, headers={'Content-Type': 'text/html; charset=utf-8'}, content=body
+        )
+
+    async def fetch() -> tuple[list[dict[str, str | int]], list[dict[str, str]], bool]:
+        async with httpx.AsyncClient(transport=httpx.MockTransport(handler)) as client:
+            hn, yahoo = await fetch_all(limit_hn=5, limit_yahoo=5, client=client)
+            return hn, yahoo, client.is_closed
+
+    hn, yahoo, closed = asyncio.run(fetch())
+
+    assert [item['title'] for item in hn] == ['HN story']
+    assert [item['title'] for item in yahoo] == ['Yahoo story']
+    assert sorted(hosts) == ['news.yahoo.com', 'news.ycombinator.com']
+    # 调用方传入的 client 由调用方负责关闭
+    assert not closed
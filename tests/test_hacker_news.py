@@ -0,0 +1,191 @@
+"""Hacker News 新闻获取模块测试（使用 httpx.MockTransport，不访问网络）。"""
+
+import pytest
+
+from news_getter import hacker_news
+
+# 与 HN 首页一致：没有 <meta charset>，编码只在 Content-Type 响应头中声明
+_STORY = """
+<tr class="athing submission" id="{id}">
+  <td><span class="titleline"><a href="{href}">{title}</a></span></td>
+</tr>
+<tr>
+  <td class="subtext">
+    <span class="score">{score} points</span> by
+    <a href="user?id={author}" class="hnuser">{author}</a>
+    <span class="age"><a href="item?id={id}">{age}</a></span>
+  </td>
+</tr>
+"""
+
+
+def _hn_page(stories: list[tuple[str, int]]) -> bytes:
+    """按 (标题, 得分) 列表构造 UTF-8 编码的 HN 首页。"""
+    rows = ''.join(
+        _STORY.format(
+            id=i,
+            href=f"https://example.com/{i}",
+            title=title,
+            score=score,
+            author=f"user{i}",
+            age=f"{i} hours ago",
+        )
+        for i, (title, score) in enumerate(stories, 1)
+    )
+    return f"<html><body><table>{rows}</table></body></html>".encode('utf-8')
+
+
+def test_fresh_parse_sorts_by_score(fake_site, use_site) -> None:
+    use_site(hacker_news._source, fake_site(_hn_page([('A', 5), ('B', 20), ('C', 10)])))
+
+    news = hacker_news.fetch_hacker_news(limit=10)
+
+    assert [item['title'] for item in news] == ['B', 'C', 'A']
+    assert news[0] == {
+        'title': 'B',
+        'url': 'https://example.com/2',
+        'score': 20,
+        'author': 'user2',
+        'date': '2 hours ago',
+    }
+
+
+def test_limit_counts_page_rows_before_sorting(fake_site, use_site) -> None:
+    use_site(hacker_news._source, fake_site(_hn_page([('A', 5), ('B', 20), ('C', 30)])))
+
+    news = hacker_news.fetch_hacker_news(limit=2)
+
+    assert [item['title'] for item in news] == ['B', 'A']
+
+
+def test_cache_hit_within_ttl(fake_site, use_site) -> None:
+    site = fake_site(_hn_page([('A', 5), ('B', 20)]))
+    use_site(hacker_news._source, site)
+
+    first = hacker_news.fetch_hacker_news(limit=10)
+    first[0]['title'] = 'modified'
+    second = hacker_news.fetch_hacker_news(limit=10)
+
+    assert len(site.requests) == 1
+    assert second[0]['title'] == 'B'
+
+
+def test_expired_entry_revalidates_with_etag(
+    fake_site,
+    use_site,
+    monkeypatch: pytest.MonkeyPatch
+) -> None:
+    site = fake_site(_hn_page([('A', 5), ('B', 20)]))
+    use_site(hacker_news._source, site)
+
+    first = hacker_news.fetch_hacker_news(limit=10)
+    monkeypatch.setattr(hacker_news._source, 'ttl', 0.0)
+    second = hacker_news.fetch_hacker_news(limit=10)
+
+    assert len(site.requests) == 2
+    assert 'If-None-Match' not in site.requests[0].headers
+    assert site.requests[1].headers['If-None-Match'] == site.etag
+    assert second == first
+
+
+def test_not_modified_without_cache_raises_value_error(
+    fake_site,
+    use_site,
+    run_async
+) -> None:
+    site = fake_site(status=304)
+    use_site(hacker_news._source, site)
+
+    with pytest.raises(ValueError, match='304'):
+        hacker_news.fetch_hacker_news(limit=10)
+    with pytest.raises(ValueError, match='304'):
+        run_async(hacker_news.fetch_hacker_news_async, site, limit=10)
+
+
+def test_columnar_matches_dict_output(fake_site, use_site) -> None:
+    use_site(hacker_news._source, fake_site(_hn_page([('A', 5), ('B', 20), ('C', 10)])))
+
+    columns = hacker_news.fetch_hacker_news_columnar(limit=10)
+    news = hacker_news.fetch_hacker_news(limit=10)
+
+    assert columns['score'].typecode == 'i'
+    assert news == [
+        {'title': title, 'url': url, 'score': score, 'author': author, 'date': date}
+        for title, url, score, author, date in zip(
+            columns['title'],
+            columns['url'],
+            columns['score'],
+            columns['author'],
+            columns['date'],
+        )
+    ]
+
+
+def test_non_ascii_titles_use_header_charset(fake_site, use_site, run_async) -> None:
+    site = fake_site(_hn_page([('Zürich — café', 10), ('東京の天気', 5)]))
+    use_site(hacker_news._source, site)
+
+    news = hacker_news.fetch_hacker_news(limit=10)
+    hacker_news.cache_clear()
+    async_news = run_async(hacker_news.fetch_hacker_news_async, site, limit=10)
+
+    assert [item['title'] for item in news] == ['Zürich — café', '東京の天気']
+    assert async_news == news
+
+
+@pytest.mark.parametrize('charset', [None, 'foo'])
+def test_missing_or_unknown_charset_falls_back_to_utf8(
+    fake_site,
+    use_site,
+    charset: str | None
+) -> None:
+    use_site(hacker_news._source, fake_site(_hn_page([('Zürich', 10)]), charset=charset))
+
+    assert hacker_news.fetch_hacker_news(limit=10)[0]['title'] == 'Zürich'
+
+
+def test_follows_redirects(fake_site, use_site, run_async) -> None:
+    site = fake_site(_hn_page([('A', 5)]), redirect_host='news.ycombinator.com')
+    use_site(hacker_news._source, site)
+
+    news = hacker_news.fetch_hacker_news(limit=10)
+    hacker_news.cache_clear()
+    async_news = run_async(hacker_news.fetch_hacker_news_async, site, limit=10)
+
+    assert [item['title'] for item in news] == ['A']
+    assert async_news == news
+    assert [request.url.host for request in site.requests] == [
+        'news.ycombinator.com', 'moved.example',
+    ] * 2
+
+
+def test_page_without_stories_raises_value_error(fake_site, use_site) -> None:
+    use_site(hacker_news._source, fake_site(b'<html><body><p>maintenance</p></body></html>'))
+
+    with pytest.raises(ValueError, match='未能解析出任何新闻条目'):
+        hacker_news.fetch_hacker_news(limit=10)
+
+
+def test_empty_body_raises_value_error(fake_site, use_site) -> None:
+    use_site(hacker_news._source, fake_site(b''))
+
+    with pytest.raises(ValueError):
+        hacker_news.fetch_hacker_news(limit=10)
+
+
+def test_async_shares_cache_and_revalidates(
+    fake_site,
+    use_site,
+    run_async,
+    monkeypatch: pytest.MonkeyPatch
+) -> None:
+    body = _hn_page([('A', 5), ('B', 20)])
+    use_site(hacker_news._source, fake_site(body))
+    first = hacker_news.fetch_hacker_news(limit=10)
+    monkeypatch.setattr(hacker_news._source, 'ttl', 0.0)
+
+    site = fake_site(body)
+    second = run_async(hacker_news.fetch_hacker_news_async, site, limit=10)
+
+    assert site.requests[0].headers['If-None-Match'] == site.etag
+    assert second == first
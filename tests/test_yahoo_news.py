@@ -0,0 +1,191 @@
+"""Yahoo News 新闻获取模块测试（使用 httpx.MockTransport，不访问网络）。"""
+
+import pytest
+
+from news_getter.yahoo_news import yahoo_news
+
+_ITEM = """
+<li class="js-stream-content stream-item">
+  <h3 data-test-locator="stream-item-title"><a href="{href}">{title}</a></h3>
+  {publisher}
+  <span data-test-locator="stream-read-time">{read_time} min read</span>
+</li>
+"""
+_PUBLISHER = '<span data-test-locator="stream-item-publisher">Reuters</span>'
+
+
+def _yahoo_page(items: list[tuple[str, str]]) -> bytes:
+    """按 (标题, 链接) 列表构造不含 <meta charset> 的 UTF-8 编码 Yahoo News 首页。
+
+    第一条新闻不带来源，用于验证默认来源。
+    """
+    rendered = ''.join(
+        _ITEM.format(
+            href=href,
+            title=title,
+            publisher='' if i == 1 else _PUBLISHER,
+            read_time=i,
+        )
+        for i, (title, href) in enumerate(items, 1)
+    )
+    return f"<html><body><ul>{rendered}</ul></body></html>".encode('utf-8')
+
+
+def test_fresh_parse_filters_non_article_links(fake_site, use_site) -> None:
+    use_site(yahoo_news._source, fake_site(_yahoo_page([
+        ('First', '/news/first.html'),
+        ('Video', '/videos/clip.html'),
+        ('Second', 'https://news.yahoo.com/articles/second.html'),
+    ])))
+
+    news = yahoo_news.fetch_yahoo_news(limit=10)
+
+    assert news == [
+        {
+            'title': 'First',
+            'url': 'https://news.yahoo.com/news/first.html',
+            'author': 'Yahoo News',
+            'date': '1 min read',
+        },
+        {
+            'title': 'Second',
+            'url': 'https://news.yahoo.com/articles/second.html',
+            'author': 'Reuters',
+            'date': '3 min read',
+        },
+    ]
+
+
+def test_stops_once_limit_items_are_built(
+    fake_site,
+    use_site,
+    monkeypatch: pytest.MonkeyPatch
+) -> None:
+    use_site(yahoo_news._source, fake_site(_yahoo_page([
+        (f"Story {i}", f"/news/story-{i}.html") for i in range(1, 6)
+    ])))
+    # 统计来源 XPath 的调用次数，即实际构建的新闻条目数
+    calls: list[object] = []
+    publisher_xpath = yahoo_news._XP_PUBLISHER
+
+    def counting_publisher(item: object) -> str:
+        calls.append(item)
+        return publisher_xpath(item)
+
+    monkeypatch.setattr(yahoo_news, '_XP_PUBLISHER', counting_publisher)
+
+    news = yahoo_news.fetch_yahoo_news(limit=2)
+
+    assert [item['title'] for item in news] == ['Story 1', 'Story 2']
+    assert len(calls) == 2
+
+
+def test_cache_hit_within_ttl(fake_site, use_site) -> None:
+    site = fake_site(_yahoo_page([('First', '/news/first.html')]))
+    use_site(yahoo_news._source, site)
+
+    first = yahoo_news.fetch_yahoo_news(limit=10)
+    first[0]['title'] = 'modified'
+    second = yahoo_news.fetch_yahoo_news(limit=10)
+
+    assert len(site.requests) == 1
+    assert second[0]['title'] == 'First'
+
+
+def test_expired_entry_revalidates_with_etag(
+    fake_site,
+    use_site,
+    monkeypatch: pytest.MonkeyPatch
+) -> None:
+    site = fake_site(_yahoo_page([('First', '/news/first.html')]))
+    use_site(yahoo_news._source, site)
+
+    first = yahoo_news.fetch_yahoo_news(limit=10)
+    monkeypatch.setattr(yahoo_news._source, 'ttl', 0.0)
+    second = yahoo_news.fetch_yahoo_news(limit=10)
+
+    assert len(site.requests) == 2
+    assert 'If-None-Match' not in site.requests[0].headers
+    assert site.requests[1].headers['If-None-Match'] == site.etag
+    assert second == first
+
+
+def test_not_modified_without_cache_raises_value_error(
+    fake_site,
+    use_site,
+    run_async
+) -> None:
+    site = fake_site(status=304)
+    use_site(yahoo_news._source, site)
+
+    with pytest.raises(ValueError, match='304'):
+        yahoo_news.fetch_yahoo_news(limit=10)
+    with pytest.raises(ValueError, match='304'):
+        run_async(yahoo_news.fetch_yahoo_news_async, site, limit=10)
+
+
+def test_non_ascii_titles_use_header_charset(fake_site, use_site, run_async) -> None:
+    site = fake_site(_yahoo_page([
+        ('Zürich — café', '/news/zurich.html'),
+        ('São Paulo', '/news/sao-paulo.html'),
+    ]))
+    use_site(yahoo_news._source, site)
+
+    news = yahoo_news.fetch_yahoo_news(limit=10)
+    yahoo_news.cache_clear()
+    async_news = run_async(yahoo_news.fetch_yahoo_news_async, site, limit=10)
+
+    assert [item['title'] for item in news] == ['Zürich — café', 'São Paulo']
+    assert async_news == news
+
+
+@pytest.mark.parametrize('charset', [None, 'foo'])
+def test_missing_or_unknown_charset_falls_back_to_utf8(
+    fake_site,
+    use_site,
+    run_async,
+    charset: str | None
+) -> None:
+    site = fake_site(_yahoo_page([('Zürich', '/news/zurich.html')]), charset=charset)
+    use_site(yahoo_news._source, site)
+
+    news = yahoo_news.fetch_yahoo_news(limit=10)
+    yahoo_news.cache_clear()
+    async_news = run_async(yahoo_news.fetch_yahoo_news_async, site, limit=10)
+
+    assert news[0]['title'] == 'Zürich'
+    assert async_news == news
+
+
+def test_follows_redirects(fake_site, use_site, run_async) -> None:
+    site = fake_site(
+        _yahoo_page([('First', '/news/first.html')]), redirect_host='news.yahoo.com'
+    )
+    use_site(yahoo_news._source, site)
+
+    news = yahoo_news.fetch_yahoo_news(limit=10)
+    yahoo_news.cache_clear()
+    async_news = run_async(yahoo_news.fetch_yahoo_news_async, site, limit=10)
+
+    assert [item['title'] for item in news] == ['First']
+    assert async_news == news
+    assert [request.url.host for request in site.requests] == [
+        'news.yahoo.com', 'moved.example',
+    ] * 2
+
+
+def test_async_sends_browser_headers_with_caller_client(fake_site, run_async) -> None:
+    site = fake_site(_yahoo_page([('First', '/news/first.html')]))
+
+    run_async(yahoo_news.fetch_yahoo_news_async, site, limit=10)
+
+    # 调用方传入的 client 没有浏览器请求头，仍需随请求一并发送
+    user_agent = site.requests[0].headers['User-Agent']
+    assert user_agent == yahoo_news._YAHOO_HEADERS['User-Agent']
+
+
+def test_page_without_items_raises_value_error(fake_site, use_site) -> None:
+    use_site(yahoo_news._source, fake_site(_yahoo_page([('Video', '/videos/clip.html')])))
+
+    with pytest.raises(ValueError, match='未能解析出任何新闻条目'):
+        yahoo_news.fetch_yahoo_news(limit=10)